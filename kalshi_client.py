@@ -3,34 +3,313 @@ Kalshi API Client
 Streamlined client for Kalshi trading API with authentication and order execution.
 """
 
+import io
 import os
+import json
 import time
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import threading
+import functools
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterator
 from enum import Enum
+from urllib.parse import urlsplit
 
 import requests
+import httpx
 import base64
+import websockets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.exceptions import InvalidSignature
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder; fall back to response.json()
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional streaming JSON parser for iter_markets
+    ijson = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional on-disk HTTP cache (KALSHI_HTTP_CACHE)
+    requests_cache = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_private_key(pem_bytes: bytes) -> rsa.RSAPrivateKey:
+    """Parse a PEM private key once; repeated client construction reuses it."""
+    return serialization.load_pem_private_key(pem_bytes, password=None)
+
+
+# Auth headers must never be written to the on-disk HTTP cache
+_AUTH_HEADERS = ('KALSHI-ACCESS-KEY', 'KALSHI-ACCESS-SIGNATURE', 'KALSHI-ACCESS-TIMESTAMP')
+
+
+def _is_cacheable_market_response(response: requests.Response) -> bool:
+    """Only market listings and single-market metadata; never orderbooks or trades."""
+    parts = urlsplit(response.url).path.rstrip('/').split('/')
+    # ['', 'trade-api', 'v2', 'markets'] or ['', 'trade-api', 'v2', 'markets', '{ticker}']
+    if parts[1:4] != ['trade-api', 'v2', 'markets']:
+        return False
+    return len(parts) == 4 or (len(parts) == 5 and parts[4] != 'trades')
+
+
+# Shared HTTP connection pool for every client in the process
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """Get or create the process-wide pooled requests session."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            cache_path = os.getenv('KALSHI_HTTP_CACHE')
+            if cache_path and requests_cache is not None:
+                # Opt-in sqlite cache for reruns/backtests: only market metadata is
+                # stored (live prices from orderbooks/trades never are), revalidated
+                # via ETag/Cache-Control once the 60s TTL lapses
+                session = requests_cache.CachedSession(
+                    cache_path,
+                    backend='sqlite',
+                    expire_after=60,
+                    cache_control=True,
+                    filter_fn=_is_cacheable_market_response,
+                    # Redacted from stored requests and left out of cache keys
+                    ignored_parameters=_AUTH_HEADERS
+                )
+            else:
+                if cache_path:
+                    logger.warning("KALSHI_HTTP_CACHE is set but requests-cache is not installed; HTTP caching disabled")
+                session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                # Idempotent methods only (urllib3 default), so orders are never re-posted
+                max_retries=Retry(
+                    total=3,
+                    connect=3,
+                    read=2,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 502, 503, 504),
+                    respect_retry_after_header=True,
+                    # Hand the final response to _raise_if_bad_response for logging
+                    raise_on_status=False
+                )
+            )
+            session.mount("https://", adapter)
+            _shared_session = session
+        return _shared_session
+
+
 class Environment(Enum):
     """Kalshi API environment options."""
     DEMO = "demo"
     PROD = "prod"
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Allows bursts up to `capacity` requests, refilling at `rate` tokens per second.
+    Tracked as the theoretical arrival time of the next request in integer
+    monotonic nanoseconds (GCRA), so the hot path does no float/object churn.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._interval_ns = int(1_000_000_000 / rate)
+        self._burst_ns = int(self._interval_ns * (capacity - 1))
+        self._tat_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now_ns = time.monotonic_ns()
+            # Later callers queue behind earlier reservations
+            tat_ns = max(self._tat_ns, now_ns)
+            self._tat_ns = tat_ns + self._interval_ns
+        wait_ns = tat_ns - self._burst_ns - now_ns
+        return wait_ns / 1_000_000_000 if wait_ns > 0 else 0.0
+
+    def acquire(self) -> None:
+        """Block until a request is allowed."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request is allowed."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class OrderbookStream:
+    """
+    Background WebSocket mirror of Kalshi orderbooks.
+    Applies snapshot/delta messages to in-memory price levels so orderbook reads
+    are a local lookup instead of a REST round-trip.
+    """
+
+    WS_PATH = "/trade-api/ws/v2"
+
+    def __init__(self, client: "KalshiClient"):
+        self.client = client
+        # ticker -> side ("yes"/"no") -> price (cents) -> resting quantity
+        self.books: Dict[str, Dict[str, Dict[int, int]]] = {}
+        self._tickers: set = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ws = None
+        self._msg_id = 0
+        # sid -> last applied seq for the current connection, to detect dropped messages
+        self._seqs: Dict[int, int] = {}
+        # Set whenever a snapshot or delta is applied
+        self._updated = threading.Event()
+
+    def start(self) -> None:
+        """Run the stream on its own event loop in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="kalshi-orderbook-stream",
+            daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+
+    def subscribe(self, tickers: List[str]) -> None:
+        """Add markets to the stream; they are (re)subscribed on every connect."""
+        with self._lock:
+            new_tickers = [t for t in tickers if t not in self._tickers]
+            if not new_tickers:
+                return
+            self._tickers.update(new_tickers)
+        if self._loop is not None and self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._send_subscribe(new_tickers), self._loop)
+
+    def get_orderbook(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Return the mirrored orderbook in REST response shape, or None if not yet received."""
+        with self._lock:
+            book = self.books.get(ticker)
+            if book is None:
+                return None
+            return {
+                "orderbook": {
+                    side: [[price, qty] for price, qty in sorted(levels.items())]
+                    for side, levels in book.items()
+                }
+            }
+
+    def wait_for_update(self, timeout: float) -> bool:
+        """Block until any mirrored book changes or `timeout` elapses; True if it changed."""
+        updated = self._updated.wait(timeout)
+        self._updated.clear()
+        return updated
+
+    async def _send_subscribe(self, tickers: List[str]) -> None:
+        self._msg_id += 1
+        await self._ws.send(json.dumps({
+            "id": self._msg_id,
+            "cmd": "subscribe",
+            "params": {"channels": ["orderbook_delta"], "market_tickers": tickers}
+        }))
+
+    async def _run(self) -> None:
+        """Connect, subscribe and apply updates forever, reconnecting on failure."""
+        url = self.client.ws_base_url + self.WS_PATH
+        while True:
+            try:
+                headers = self.client._request_headers("GET", self.WS_PATH)
+                async with websockets.connect(url, additional_headers=headers) as ws:
+                    self._ws = ws
+                    self._seqs.clear()
+                    with self._lock:
+                        tickers = list(self._tickers)
+                    if tickers:
+                        await self._send_subscribe(tickers)
+                    async for raw in ws:
+                        if not self._handle_message(json.loads(raw)):
+                            # A missed delta leaves the mirror wrong for good; reconnect
+                            # to get fresh snapshots
+                            logger.warning("Orderbook stream sequence gap, resubscribing")
+                            break
+            except Exception as e:
+                logger.error(f"Orderbook stream error: {e}")
+            finally:
+                self._ws = None
+                # Mirrored books are stale once disconnected; callers fall back to REST
+                with self._lock:
+                    self.books.clear()
+            await asyncio.sleep(1)
+
+    def _handle_message(self, message: Dict[str, Any]) -> bool:
+        """Apply an orderbook snapshot or delta to the local mirror; False on a sequence gap."""
+        msg_type = message.get("type")
+        sid = message.get("sid")
+        seq = message.get("seq")
+        if sid is not None and seq is not None:
+            last = self._seqs.get(sid)
+            if last is not None and seq != last + 1:
+                return False
+            self._seqs[sid] = seq
+        msg = message.get("msg", {})
+        ticker = msg.get("market_ticker")
+
+        if msg_type == "orderbook_snapshot":
+            book = {
+                side: {int(price): int(qty) for price, qty in msg.get(side, [])}
+                for side in ("yes", "no")
+            }
+            with self._lock:
+                self.books[ticker] = book
+            self._updated.set()
+        elif msg_type == "orderbook_delta":
+            with self._lock:
+                book = self.books.get(ticker)
+                if book is None:
+                    return True
+                levels = book[msg["side"]]
+                price = int(msg["price"])
+                qty = levels.get(price, 0) + int(msg["delta"])
+                if qty > 0:
+                    levels[price] = qty
+                else:
+                    levels.pop(price, None)
+            self._updated.set()
+        elif msg_type == "error":
+            logger.error(f"Orderbook stream error message: {msg}")
+        return True
+
+
 class KalshiClient:
     """
     Streamlined Kalshi client for trading operations.
     Handles authentication, market data fetching, and order execution.
     """
 
+    # Market metadata cache TTL in seconds; orderbooks are never cached since
+    # orders are priced off them
+    MARKET_CACHE_TTL = 60.0
+    CACHE_MAXSIZE = 2048
+
+    # (connect, read) timeouts in seconds so a stalled socket can't hang callers
+    REQUEST_TIMEOUT = (2.0, 5.0)
+
     def __init__(
         self,
         key_id: Optional[str] = None,
@@ -47,7 +326,13 @@ class KalshiClient:
         """
         self.key_id = key_id or os.getenv('KALSHI_API_KEY_ID')
         self.environment = environment
-        self.last_api_call = datetime.now()
+        # Reads (sync and async paths): bursts up to capacity, refills at rate/s
+        rate = float(os.getenv('KALSHI_MAX_REQUESTS_PER_SECOND', '20'))
+        self._limiter = TokenBucket(rate=rate, capacity=rate)
+        # Order writes (POST/DELETE) have their own, lower limit on Kalshi; orders are
+        # never retried on 429, so exceeding it could leave one arb leg unhedged
+        write_rate = float(os.getenv('KALSHI_MAX_WRITES_PER_SECOND', '10'))
+        self._write_limiter = TokenBucket(rate=write_rate, capacity=write_rate)
         
         # Load private key if not provided
         if private_key is None:
@@ -57,10 +342,7 @@ class KalshiClient:
                 try:
                     # Handle escaped newlines in the key
                     key_content = inline_key.replace('\\n', '\n').encode('utf-8')
-                    self.private_key = serialization.load_pem_private_key(
-                        key_content,
-                        password=None
-                    )
+                    self.private_key = _load_private_key(key_content)
                 except Exception as e:
                     logger.error(f"Failed to load inline private key: {e}")
                     self.private_key = None
@@ -69,10 +351,7 @@ class KalshiClient:
                 key_file_path = os.getenv('KALSHI_PRIVATE_KEY_PATH')
                 if key_file_path and os.path.exists(key_file_path):
                     with open(key_file_path, 'rb') as key_file:
-                        self.private_key = serialization.load_pem_private_key(
-                            key_file.read(),
-                            password=None
-                        )
+                        self.private_key = _load_private_key(key_file.read())
                 else:
                     self.private_key = None
         else:
@@ -100,6 +379,28 @@ class KalshiClient:
             self.mode = "read-only"
             logger.warning("Initialized Kalshi client in read-only mode (no credentials)")
 
+        # Process-wide pooled HTTP session so keep-alive reuses TLS connections
+        self.session = get_shared_session()
+
+        # RSA-PSS padding is stateless, so build it once for every signature
+        self._pss_padding = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH
+        )
+
+        # Async HTTP/2 client for concurrent fan-out; created lazily on first use
+        self.aclient: Optional[httpx.AsyncClient] = None
+        # Max in-flight async requests during fan-out
+        self.pipeline_depth = int(os.getenv('KALSHI_PIPELINE_DEPTH', '32'))
+
+        # WebSocket orderbook mirror, started on demand via start_orderbook_stream
+        self.orderbook_stream: Optional[OrderbookStream] = None
+
+        # In-process TTL cache for market metadata: key -> (expires_at, value)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # Callers may fetch from worker threads, so every cache access is locked
+        self._cache_lock = threading.Lock()
+
     def _sign_pss_text(self, text: str) -> str:
         """Sign text using RSA-PSS and return base64 encoded signature."""
         if not self.private_key:
@@ -109,10 +410,7 @@ class KalshiClient:
         try:
             signature = self.private_key.sign(
                 message,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.DIGEST_LENGTH
-                ),
+                self._pss_padding,
                 hashes.SHA256()
             )
             return base64.b64encode(signature).decode('utf-8')
@@ -124,13 +422,11 @@ class KalshiClient:
         if not self.key_id or not self.private_key:
             return {"Content-Type": "application/json"}
         
-        current_time_milliseconds = int(time.time() * 1000)
-        timestamp_str = str(current_time_milliseconds)
+        # Integer milliseconds straight from the ns clock, no float round-trip
+        timestamp_str = str(time.time_ns() // 1_000_000)
         
         # Remove query params from path for signature
-        path_parts = path.split('?')
-        msg_string = timestamp_str + method + path_parts[0]
-        signature = self._sign_pss_text(msg_string)
+        signature = self._sign_pss_text(f"{timestamp_str}{method}{path.partition('?')[0]}")
         
         return {
             "Content-Type": "application/json",
@@ -139,56 +435,165 @@ class KalshiClient:
             "KALSHI-ACCESS-TIMESTAMP": timestamp_str,
         }
 
-    def _rate_limit(self) -> None:
-        """Rate limiter to prevent exceeding API limits."""
-        THRESHOLD_IN_MILLISECONDS = 100
-        now = datetime.now()
-        threshold_in_microseconds = 1000 * THRESHOLD_IN_MILLISECONDS
-        threshold_in_seconds = THRESHOLD_IN_MILLISECONDS / 1000
-        if now - self.last_api_call < timedelta(microseconds=threshold_in_microseconds):
-            time.sleep(threshold_in_seconds)
-        self.last_api_call = datetime.now()
+    def _rate_limit(self, write: bool = False) -> None:
+        """Rate limiter to prevent exceeding API limits (separate budget for writes)."""
+        if write:
+            self._write_limiter.acquire()
+        else:
+            self._limiter.acquire()
 
     def _raise_if_bad_response(self, response: requests.Response) -> None:
         """Raise HTTPError if response indicates an error."""
         if response.status_code not in range(200, 299):
-            logger.error(f"API error: {response.status_code} - {response.text}")
+            # Only decode the head of the body; error pages can be large
+            body = response.content[:512].decode('utf-8', 'replace')
+            logger.error(f"API error: {response.status_code} - {body}")
             response.raise_for_status()
 
+    def _decode_json(self, response: Any) -> Any:
+        """Decode a JSON response body, using orjson on the raw bytes when available."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _cache_get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cached response that hasn't expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    def _cache_set(self, key: Tuple, value: Any, ttl: float) -> Any:
+        """Store a response in the cache for `ttl` seconds."""
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAXSIZE:
+                # Evict expired entries first, then the oldest insertion
+                for k in [k for k, v in self._cache.items() if v[0] <= now]:
+                    del self._cache[k]
+                if len(self._cache) >= self.CACHE_MAXSIZE:
+                    self._cache.pop(next(iter(self._cache)))
+            self._cache.pop(key, None)
+            self._cache[key] = (now + ttl, value)
+        return value
+
     def get(self, path: str, params: Dict[str, Any] = None) -> Any:
         """Perform authenticated GET request."""
         self._rate_limit()
         params = params or {}
-        response = requests.get(
+        response = self.session.get(
             self.http_base_url + path,
             headers=self._request_headers("GET", path),
-            params=params
+            params=params,
+            timeout=self.REQUEST_TIMEOUT
         )
         self._raise_if_bad_response(response)
-        return response.json()
+        return self._decode_json(response)
 
     def post(self, path: str, body: Dict[str, Any]) -> Any:
         """Perform authenticated POST request."""
-        self._rate_limit()
-        response = requests.post(
+        self._rate_limit(write=True)
+        response = self.session.post(
             self.http_base_url + path,
             json=body,
-            headers=self._request_headers("POST", path)
+            headers=self._request_headers("POST", path),
+            timeout=self.REQUEST_TIMEOUT
         )
         self._raise_if_bad_response(response)
-        return response.json()
+        return self._decode_json(response)
 
     def delete(self, path: str, params: Dict[str, Any] = None) -> Any:
         """Perform authenticated DELETE request."""
-        self._rate_limit()
+        self._rate_limit(write=True)
         params = params or {}
-        response = requests.delete(
+        response = self.session.delete(
             self.http_base_url + path,
             headers=self._request_headers("DELETE", path),
+            params=params,
+            timeout=self.REQUEST_TIMEOUT
+        )
+        self._raise_if_bad_response(response)
+        return self._decode_json(response)
+
+    # Async Methods
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Get or create the shared async HTTP/2 client."""
+        if self.aclient is None or self.aclient.is_closed:
+            self.aclient = httpx.AsyncClient(
+                base_url=self.http_base_url,
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=httpx.Timeout(self.REQUEST_TIMEOUT[1], connect=self.REQUEST_TIMEOUT[0])
+            )
+        return self.aclient
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self.aclient is not None:
+            await self.aclient.aclose()
+            self.aclient = None
+
+    async def _aget(self, path: str, params: Dict[str, Any] = None) -> Any:
+        """Perform authenticated GET request on the async client."""
+        await self._limiter.acquire_async()
+        params = params or {}
+        response = await self._get_aclient().get(
+            path,
+            headers=self._request_headers("GET", path),
             params=params
         )
         self._raise_if_bad_response(response)
-        return response.json()
+        return self._decode_json(response)
+
+    async def aget_orderbook(self, ticker: str, depth: Optional[int] = None) -> Dict[str, Any]:
+        """Get orderbook for a specific market (async)."""
+        params = {}
+        if depth:
+            params['depth'] = depth
+        return await self._aget(f"{self.markets_url}/{ticker}/orderbook", params)
+
+    async def aget_orderbooks(
+        self,
+        tickers: List[str],
+        depth: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch orderbooks for many markets concurrently.
+
+        At most `pipeline_depth` requests are in flight at once so large fan-outs
+        stay under the API rate limit and don't exhaust sockets.
+
+        Returns:
+            Dict of ticker -> orderbook, or the raised exception if that fetch failed
+        """
+        sem = asyncio.Semaphore(self.pipeline_depth)
+
+        async def _fetch(ticker: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.aget_orderbook(ticker, depth)
+
+        results = await asyncio.gather(
+            *(_fetch(ticker) for ticker in tickers),
+            return_exceptions=True
+        )
+        return dict(zip(tickers, results))
+
+    def get_orderbooks(
+        self,
+        tickers: List[str],
+        depth: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Sync wrapper around aget_orderbooks for non-async callers."""
+        async def _run() -> Dict[str, Any]:
+            try:
+                return await self.aget_orderbooks(tickers, depth)
+            finally:
+                # The client is bound to this event loop, which asyncio.run discards
+                await self.aclose()
+
+        return asyncio.run(_run())
 
     # Market Data Methods
     
@@ -200,6 +605,16 @@ class KalshiClient:
         series_ticker: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get markets with optional filters."""
+        return self.get(self.markets_url, self._markets_params(limit, cursor, status, series_ticker))
+
+    @staticmethod
+    def _markets_params(
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        series_ticker: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build query params for the markets listing endpoint."""
         params = {}
         if limit:
             params['limit'] = limit
@@ -209,20 +624,100 @@ class KalshiClient:
             params['status'] = status
         if series_ticker:
             params['series_ticker'] = series_ticker
+        return params
+
+    def iter_markets(
+        self,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        limit: Optional[int] = 1000,
+        status: Optional[str] = None,
+        series_ticker: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream markets one at a time, yielding those that match `predicate`.
         
-        return self.get(self.markets_url, params)
+        With ijson installed the response body is parsed incrementally, so a large
+        market list is never held in memory as a whole and rejected markets are
+        dropped as soon as they are read.
+        """
+        if ijson is None:
+            markets = self.get_markets(limit=limit, status=status, series_ticker=series_ticker)
+            for market in markets.get('markets', []):
+                if predicate is None or predicate(market):
+                    yield market
+            return
+
+        self._rate_limit()
+        with self.session.get(
+            self.http_base_url + self.markets_url,
+            headers=self._request_headers("GET", self.markets_url),
+            params=self._markets_params(limit, status=status, series_ticker=series_ticker),
+            timeout=self.REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            self._raise_if_bad_response(response)
+            if getattr(response, 'from_cache', False):
+                # requests-cache replays the body from memory, and its raw stream
+                # doesn't survive ijson's read(0) probe; parse the cached bytes
+                body = io.BytesIO(response.content)
+            else:
+                # Let urllib3 undo gzip/deflate before ijson reads the raw stream
+                response.raw.decode_content = True
+                body = response.raw
+            for market in ijson.items(body, 'markets.item', use_float=True):
+                if predicate is None or predicate(market):
+                    yield market
 
     def get_market(self, ticker: str) -> Dict[str, Any]:
         """Get specific market by ticker."""
-        return self.get(f"{self.markets_url}/{ticker}")
+        key = ('market', ticker)
+        hit, cached = self._cache_get(key)
+        if hit:
+            return cached
+        market = self.get(f"{self.markets_url}/{ticker}")
+        return self._cache_set(key, market, self.MARKET_CACHE_TTL)
 
     def get_orderbook(self, ticker: str, depth: Optional[int] = None) -> Dict[str, Any]:
         """Get orderbook for a specific market."""
+        if self.orderbook_stream is not None and not depth:
+            streamed = self.orderbook_stream.get_orderbook(ticker)
+            if streamed is not None:
+                return streamed
+            # Cold start: subscribe for next time and serve this call from REST
+            self.orderbook_stream.subscribe([ticker])
+
         params = {}
         if depth:
             params['depth'] = depth
         return self.get(f"{self.markets_url}/{ticker}/orderbook", params)
 
+    def start_orderbook_stream(self, tickers: Optional[List[str]] = None) -> None:
+        """
+        Mirror orderbooks over WebSocket so get_orderbook skips REST polling.
+        
+        Args:
+            tickers: Markets to subscribe to up front; others subscribe on first get_orderbook
+        """
+        if self.mode != "trading":
+            logger.warning("Cannot stream orderbooks in read-only mode (WebSocket requires auth)")
+            return
+        if self.orderbook_stream is None:
+            self.orderbook_stream = OrderbookStream(self)
+            self.orderbook_stream.start()
+        if tickers:
+            self.orderbook_stream.subscribe(tickers)
+
+    def wait_for_orderbook_update(self, timeout: float) -> bool:
+        """
+        Wait for the orderbook stream to push a change, up to `timeout` seconds.
+        
+        Without a running stream this just sleeps for `timeout`, matching a polling loop.
+        """
+        if self.orderbook_stream is None:
+            time.sleep(timeout)
+            return False
+        return self.orderbook_stream.wait_for_update(timeout)
+
     def get_trades(
         self,
         ticker: Optional[str] = None,
@@ -314,7 +809,7 @@ class KalshiClient:
                 order_data["expiration_ts"] = expiration_ts
             
             result = self.post(self.orders_url, order_data)
-            logger.info(f"Created {action} {side} order for {ticker}: {count} contracts")
+            logger.info("Created %s %s order for %s: %s contracts", action, side, ticker, count)
             return result
             
         except Exception as e:
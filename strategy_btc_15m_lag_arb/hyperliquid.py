@@ -9,9 +9,15 @@ from __future__ import annotations
 import time
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder; fall back to resp.json()
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -23,26 +29,47 @@ class PriceTick:
 
 
 class HyperliquidClient:
+    # How long one allMids snapshot is reused across symbol lookups
+    MIDS_CACHE_TTL = 0.1
+
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
+        # Persistent keep-alive connection so each poll skips the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        # (expires_at monotonic, fetched ts_ms, mids)
+        self._mids_cache: Optional[Tuple[float, int, Dict[str, str]]] = None
+
+    def _get_all_mids(self) -> Tuple[int, Dict[str, str]]:
+        """Return (ts_ms, mids) from one `allMids` fetch, shared for MIDS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._mids_cache
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+
+        url = f"{self.base_url}/info"
+        resp = self.session.post(url, json={"type": "allMids"}, timeout=1.5)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content) if orjson is not None else resp.json()
+        mids = data.get("mids") or {}
+        ts_ms = int(time.time() * 1000)
+        self._mids_cache = (now + self.MIDS_CACHE_TTL, ts_ms, mids)
+        return ts_ms, mids
 
     def get_btc_price(self, symbol: str = "BTC") -> Optional[PriceTick]:
         """Fetch BTC price from Hyperliquid.
 
-        Uses `POST /info` with type `allMids`.
+        Uses `POST /info` with type `allMids`; lookups within MIDS_CACHE_TTL
+        share one request.
         """
         try:
-            url = f"{self.base_url}/info"
-            resp = requests.post(url, json={"type": "allMids"}, timeout=1.5)
-            resp.raise_for_status()
-            data = resp.json()
-            mids = data.get("mids") or {}
+            ts_ms, mids = self._get_all_mids()
             # Some deployments use "BTC"; others use perp symbols. We'll try direct symbol first.
             px = mids.get(symbol)
             if px is None:
                 # common perp key is "BTC" on allMids, so if missing, just fail fast.
                 return None
-            return PriceTick(ts_ms=int(time.time() * 1000), price=float(px))
+            return PriceTick(ts_ms=ts_ms, price=float(px))
         except Exception as e:
             logger.error(f"Hyperliquid price fetch failed: {e}")
             return None
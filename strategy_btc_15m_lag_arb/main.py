@@ -7,8 +7,10 @@ movements and looks for stale pricing in Kalshi BTC markets.
 """
 
 import os
+import re
 import time
 import logging
+import requests
 from dotenv import load_dotenv
 
 from common import get_client
@@ -19,6 +21,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Single case-insensitive scan instead of lowering the title and testing each keyword
+BTC_TITLE_PATTERN = re.compile(r"bitcoin|btc", re.IGNORECASE)
+
+# Backoff bounds (seconds) for transient network errors in the main loop
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+
 
 def main() -> None:
     load_dotenv()
@@ -30,36 +39,57 @@ def main() -> None:
     if not btc_ticker:
         logger.warning("No KALSHI_BTC_TICKER set. Listing BTC markets...")
         client = get_client()
-        markets = client.get_markets(limit=100, status='open')
-        btc_markets = [m for m in markets.get('markets', []) 
-                      if 'bitcoin' in m.get('title', '').lower() or 'btc' in m.get('title', '').lower()]
+        series_ticker = os.getenv('KALSHI_BTC_SERIES_TICKER')  # e.g., KXBTCD
+        if series_ticker:
+            # Already filtered server-side by series
+            predicate = None
+        else:
+            predicate = lambda m: BTC_TITLE_PATTERN.search(m.get('title', '')) is not None
+        btc_markets = list(client.iter_markets(predicate, limit=100, status='open', series_ticker=series_ticker))
         
-        logger.info(f"Found {len(btc_markets)} BTC markets:")
-        for market in btc_markets:
-            logger.info(f"  - {market.get('ticker')}: {market.get('title')}")
+        # One log record for the whole listing instead of one per market
+        lines = [f"  - {market.get('ticker')}: {market.get('title')}" for market in btc_markets]
+        logger.info("\n".join([f"Found {len(btc_markets)} BTC markets:", *lines]))
         
         return
     
     client = get_client()
     logger.info(f"Starting BTC lag-arb for ticker: {btc_ticker}")
     
+    # Keep the orderbook mirrored over WebSocket; get_orderbook falls back to REST until warm
+    client.start_orderbook_stream([btc_ticker])
+    
     # Simple loop
+    backoff = INITIAL_BACKOFF_SECONDS
+    next_log_ts = 0.0
     while True:
         try:
             # Get current orderbook
             orderbook = client.get_orderbook(btc_ticker)
-            
-            # TODO: Implement lag arbitrage logic:
-            # 1. Fetch external BTC price from a fast feed (e.g., Coinbase, Binance)
-            # 2. Compare with Kalshi market prices
-            # 3. If Kalshi is stale relative to external price movement, place orders
-            
+        except (requests.RequestException, ConnectionError, TimeoutError) as e:
+            # Transient network/API failure: retry with exponential backoff.
+            # Anything else propagates so the process manager can restart us.
+            logger.warning(f"Transient error in lag-arb loop, retrying in {backoff:.0f}s: {e}")
+            time.sleep(backoff)
+            backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            continue
+        backoff = INITIAL_BACKOFF_SECONDS
+        
+        # TODO: Implement lag arbitrage logic:
+        # 1. Fetch external BTC price from a fast feed (e.g., Coinbase, Binance)
+        # 2. Compare with Kalshi market prices
+        # 3. If Kalshi is stale relative to external price movement, place orders
+        
+        # The stream wakes us on every delta; only dump the full book at INFO once per poll interval
+        now = time.monotonic()
+        if now >= next_log_ts:
             logger.info(f"Orderbook: {orderbook}")
-            
-        except Exception as e:
-            logger.error(f"Error in lag-arb loop: {e}", exc_info=True)
+            next_log_ts = now + poll_interval_seconds
+        else:
+            logger.debug("Orderbook: %s", orderbook)
         
-        time.sleep(poll_interval_seconds)
+        # Wake as soon as the streamed book changes; poll interval is the upper bound
+        client.wait_for_orderbook_update(poll_interval_seconds)
 
 
 if __name__ == "__main__":
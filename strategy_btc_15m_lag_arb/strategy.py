@@ -17,7 +17,7 @@ import os
 import time
 import logging
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import Dict, Optional, Literal, Tuple
 
 from py_clob_client.order_builder.constants import BUY, SELL
 
@@ -51,7 +51,7 @@ class Config:
     dry_run: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     side: Side
     token_id: str
@@ -73,24 +73,34 @@ class BTCLagArb:
         self.position: Optional[Position] = None
         self.cooldown_until_ts: float = 0.0
 
+        # token_id -> (expires_at monotonic, top of book); PM is polled at pm_poll_ms
+        self._pm_top_cache: Dict[str, Tuple[float, object]] = {}
+
     @staticmethod
     def _mid(best_bid: Optional[float], best_ask: Optional[float]) -> Optional[float]:
         if best_bid is None or best_ask is None:
             return None
         return (best_bid + best_ask) / 2
 
-    def _poll_pm_mid(self, token_id: str) -> Optional[float]:
-        ob = self.clob.get_orderbook(token_id)
-        if not ob:
-            return None
-        tob = self.clob.top_of_book(ob)
-        return self._mid(tob.best_bid, tob.best_ask)
+    @staticmethod
+    def _order_id(res) -> Optional[str]:
+        """Pull the order ID out of a post-order response without formatting the whole payload."""
+        if isinstance(res, dict):
+            return res.get("orderID") or res.get("order_id")
+        return None
 
     def _poll_pm_top(self, token_id: str):
+        now = time.monotonic()
+        cached = self._pm_top_cache.get(token_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         ob = self.clob.get_orderbook(token_id)
         if not ob:
             return None
-        return self.clob.top_of_book(ob)
+        tob = self.clob.top_of_book(ob)
+        self._pm_top_cache[token_id] = (now + self.cfg.pm_poll_ms / 1000.0, tob)
+        return tob
 
     def _estimate_shares_for_usdc(self, usdc: float, price: float) -> float:
         # shares ~ usdc / price (since price is $ per share)
@@ -116,8 +126,10 @@ class BTCLagArb:
             return True
 
         res = self.clob.place_fok_limit_order(token_id=token_id, side=BUY, size=size_shares, price=best_ask)
+        # Filled or not, the cached top is now suspect (a FOK miss means it was stale)
+        self._pm_top_cache.pop(token_id, None)
         if res:
-            logger.info(f"ENTER {side}: BUY {size_shares:.4f} @ {best_ask:.4f} token={token_id} res={res}")
+            logger.info(f"ENTER {side}: BUY {size_shares:.4f} @ {best_ask:.4f} token={token_id} order_id={self._order_id(res)}")
             self.position = Position(side=side, token_id=token_id, entry_price=best_ask, entry_ts=time.time(), size_shares=size_shares)
             return True
 
@@ -143,8 +155,9 @@ class BTCLagArb:
             return True
 
         res = self.clob.place_fok_limit_order(token_id=self.position.token_id, side=SELL, size=size_shares, price=best_bid)
+        self._pm_top_cache.pop(self.position.token_id, None)
         if res:
-            logger.info(f"EXIT {self.position.side}: SELL {size_shares:.4f} @ {best_bid:.4f} res={res}")
+            logger.info(f"EXIT {self.position.side}: SELL {size_shares:.4f} @ {best_bid:.4f} order_id={self._order_id(res)}")
             self.position = None
             self.cooldown_until_ts = time.time() + self.cfg.cooldown_seconds
             return True
@@ -164,11 +177,14 @@ class BTCLagArb:
         else:
             return
 
-        # Update PM mids (coarser)
-        up_mid = self._poll_pm_mid(self.cfg.token_up)
-        down_mid = self._poll_pm_mid(self.cfg.token_down)
+        # Update PM mids (coarser). Each book is fetched once per step and reused below.
+        up_tob = self._poll_pm_top(self.cfg.token_up)
+        down_tob = self._poll_pm_top(self.cfg.token_down)
+        up_mid = self._mid(up_tob.best_bid, up_tob.best_ask) if up_tob else None
+        down_mid = self._mid(down_tob.best_bid, down_tob.best_ask) if down_tob else None
         if up_mid is None or down_mid is None:
             return
+        tops = {self.cfg.token_up: up_tob, self.cfg.token_down: down_tob}
 
         if self.last_pm_mid_up is None:
             self.last_pm_mid_up = up_mid
@@ -182,13 +198,13 @@ class BTCLagArb:
             held_for = now - self.position.entry_ts
             if held_for >= self.cfg.max_hold_seconds:
                 logger.info(f"Max hold exceeded ({held_for:.1f}s) -> attempting exit")
-                tob = self._poll_pm_top(self.position.token_id)
+                tob = tops.get(self.position.token_id)
                 if tob and tob.best_bid is not None:
                     self._exit(tob.best_bid, tob.best_bid_size)
                 return
 
             # Simple exit condition: PM mid moved favorably relative to entry.
-            tob = self._poll_pm_top(self.position.token_id)
+            tob = tops.get(self.position.token_id)
             if not tob or tob.best_bid is None or tob.best_ask is None:
                 return
 
@@ -210,7 +226,7 @@ class BTCLagArb:
 
         # If BTC up violently, expect UP token price to rise -> buy UP if its book hasn't moved much.
         if hl_ret > 0:
-            tob = self._poll_pm_top(self.cfg.token_up)
+            tob = up_tob
             if not tob or tob.best_ask is None or tob.best_ask_size is None:
                 return
 
@@ -220,7 +236,7 @@ class BTCLagArb:
 
         # If BTC down violently, expect DOWN token price to rise -> buy DOWN.
         else:
-            tob = self._poll_pm_top(self.cfg.token_down)
+            tob = down_tob
             if not tob or tob.best_ask is None or tob.best_ask_size is None:
                 return
 
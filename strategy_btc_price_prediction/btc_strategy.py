@@ -15,11 +15,61 @@ import numpy as np
 from datetime import datetime, timezone
 import re
 
+try:
+    import ciso8601
+except ImportError:  # Optional C parser; fall back to stdlib below
+    ciso8601 = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional JIT; kernels below run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 from common import TradeSignal, get_clob_client
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Explicit signatures compile eagerly at import (or load from the on-disk
+# cache) so the first analysis cycle doesn't pay JIT latency.
+_KERNEL_SIGNATURE = "float64(float64, float64, float64, float64, float64)"
+
+
+@njit(_KERNEL_SIGNATURE, cache=True)
+def _theoretical_prob(S: float, K: float, T: float, sigma: float, r: float) -> float:
+    """P(S_T > K) = N(d2) under Black-Scholes, compiled for the per-pair hot loop."""
+    if T <= 0:
+        return 1.0 if S > K else 0.0
+    # math.log raised on these before compilation; under numba it would silently yield nan
+    if not (S > 0.0 and K > 0.0):
+        raise ValueError("S and K must be positive")
+    d2 = (math.log(S / K) + (r - 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
+    return (1.0 + math.erf(d2 / math.sqrt(2.0))) / 2.0
+
+
+@njit(_KERNEL_SIGNATURE, cache=True)
+def _implied_vol_search(price: float, S: float, K: float, T: float, r: float) -> float:
+    """Bisection over 10%-300% vol for the N(d2) that matches `price`."""
+    low, high = 0.1, 3.0
+    for _ in range(10):
+        mid = (low + high) / 2
+        prob = _theoretical_prob(S, K, T, mid, r)
+        if prob < price:
+            high = mid
+            # If S < K (OTM), higher vol -> higher prob; if ITM, higher vol -> lower prob.
+            if S < K:
+                low = mid
+            else:
+                high = mid
+        else:
+            if S < K:
+                high = mid
+            else:
+                low = mid
+    return (low + high) / 2
+
+@dataclass(slots=True)
 class BTCMarket:
     market_id: str
     question: str
@@ -55,26 +105,28 @@ class DeribitService:
             return None
 
     @staticmethod
-    def get_option_iv(expiry_date: datetime, strike: float) -> Optional[float]:
-        """
-        Get IV for a specific option from Deribit.
-        Finds the closest matching option instrument.
-        """
+    def get_option_summaries() -> Optional[List[Dict]]:
+        """Fetch the book summary for every BTC option on Deribit (one large request)."""
         try:
             url = f"{DeribitService.BASE_URL}/get_book_summary_by_currency?currency=BTC&kind=option"
             response = requests.get(url, timeout=5)
             if response.status_code != 200:
                 return None
-                
-            data = response.json()
-            options = data.get('result', [])
-            
+            return response.json().get('result', [])
+        except Exception as e:
+            logger.error(f"Error fetching Deribit option summaries: {e}")
+            return None
+
+    @staticmethod
+    def match_option_iv(options: List[Dict], expiry_date: datetime, strike: float) -> Optional[float]:
+        """
+        Find the IV of the closest matching option instrument in a book summary.
+        """
+        try:
             # Deribit format: BTC-29DEC23-100000-C
             # Polymarket expiry might not match Deribit exactly.
             # We should look for the closest expiry in Deribit.
             
-            target_timestamp = expiry_date.timestamp()
-            
             best_match = None
             min_score = float('inf') # Score = weighted diff of expiry and strike
             
@@ -121,7 +173,7 @@ class DeribitService:
             return None
             
         except Exception as e:
-            logger.error(f"Error fetching Deribit Option IV: {e}")
+            logger.error(f"Error matching Deribit Option IV: {e}")
             return None
 
 class BTCPricePredictionStrategy:
@@ -139,6 +191,7 @@ class BTCPricePredictionStrategy:
         self.risk_free_rate = 0.045  # 4.5% risk free rate
         self.fixed_volatility = config.get('fixed_volatility', 0.65) # Fallback vol if IV calc fails
         self.use_deribit_vol = config.get('use_deribit_vol', True)
+        self.max_size = config.get('max_size', 50)
         
     def get_current_btc_price(self) -> Optional[float]:
         """Fetch real-time BTC price from CoinGecko."""
@@ -182,7 +235,10 @@ class BTCPricePredictionStrategy:
             
         try:
             # Handle ISO format (e.g., "2025-12-31T23:59:59Z")
-            expiry_date = datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
+            if ciso8601 is not None:
+                expiry_date = ciso8601.parse_datetime(expiry_str)
+            else:
+                expiry_date = datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
         except ValueError:
             return None
         
@@ -197,20 +253,12 @@ class BTCPricePredictionStrategy:
             volume=float(market_data.get('volume', 0) or 0)
         )
 
-    def _norm_cdf(self, x):
-        """Cumulative distribution function for the standard normal distribution."""
-        return (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
-
     def calculate_theoretical_prob(self, S: float, K: float, T: float, sigma: float) -> float:
         """
         Calculate theoretical probability P(S_T > K) using Black-Scholes logic.
         In risk-neutral world, this is N(d2).
         """
-        if T <= 0:
-            return 1.0 if S > K else 0.0
-            
-        d2 = (math.log(S / K) + (self.risk_free_rate - 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-        return self._norm_cdf(d2)
+        return _theoretical_prob(S, K, T, sigma, self.risk_free_rate)
 
     def calculate_implied_vol(self, price: float, S: float, K: float, T: float) -> float:
         """
@@ -220,25 +268,7 @@ class BTCPricePredictionStrategy:
         if price <= 0.01 or price >= 0.99:
             return self.fixed_volatility # Too extreme to calculate reliable IV
             
-        low, high = 0.1, 3.0 # Volatility range 10% to 300%
-        for _ in range(10):
-            mid = (low + high) / 2
-            prob = self.calculate_theoretical_prob(S, K, T, mid)
-            if prob < price:
-                high = mid # Need lower vol (usually? depends on moneyness)
-                # Wait, if S < K (OTM), higher vol -> higher prob.
-                # If S > K (ITM), higher vol -> lower prob (time value erosion).
-                # Let's handle direction correctly.
-                if S < K:
-                    low = mid # Need higher vol to reach OTM strike
-                else:
-                    high = mid # Need lower vol to maintain ITM probability
-            else:
-                if S < K:
-                    high = mid
-                else:
-                    low = mid
-        return (low + high) / 2
+        return _implied_vol_search(price, S, K, T, self.risk_free_rate)
 
     def analyze_conditional_probabilities(self, markets: List[BTCMarket], current_btc_price: float) -> List[TradeSignal]:
         """
@@ -256,12 +286,32 @@ class BTCPricePredictionStrategy:
                 markets_by_expiry[m.expiry_date] = []
             markets_by_expiry[m.expiry_date].append(m)
             
+        # Time to expiry (in years); expiries too close to settlement are skipped below
+        times_to_expiry = {
+            expiry: (expiry - now).total_seconds() / (365 * 24 * 3600)
+            for expiry in markets_by_expiry
+        }
+        
+        # One Deribit option summary download serves every expiry we'll actually analyze,
+        # and DVOL (same payload for every expiry) is fetched once if any expiry needs it
+        deribit_ivs = {}
+        dvol = None
+        if self.use_deribit_vol:
+            tradable = [expiry for expiry, T in times_to_expiry.items() if T >= 0.001]
+            options = DeribitService.get_option_summaries() if tradable else None
+            if options:
+                deribit_ivs = {
+                    expiry: DeribitService.match_option_iv(options, expiry, current_btc_price)
+                    for expiry in tradable
+                }
+            if any(not deribit_ivs.get(expiry) for expiry in tradable):
+                dvol = DeribitService.get_btc_volatility_index()
+            
         for expiry, expiry_markets in markets_by_expiry.items():
             # Sort by strike price
             sorted_markets = sorted(expiry_markets, key=lambda x: x.strike_price)
             
-            # Calculate Time to Expiry (in years)
-            T = (expiry - now).total_seconds() / (365 * 24 * 3600)
+            T = times_to_expiry[expiry]
             if T < 0.001: continue # Too close to expiry
             
             # 1. Determine Baseline Volatility
@@ -274,13 +324,12 @@ class BTCPricePredictionStrategy:
             
             if self.use_deribit_vol:
                 # Try to get specific option IV first
-                atm_iv = DeribitService.get_option_iv(expiry, current_btc_price)
+                atm_iv = deribit_ivs.get(expiry)
                 if atm_iv:
                     baseline_vol = atm_iv
                     logger.info(f"Using Deribit ATM IV: {atm_iv:.2%}")
                 else:
                     # Fallback to DVOL
-                    dvol = DeribitService.get_btc_volatility_index()
                     if dvol:
                         baseline_vol = dvol
                         logger.info(f"Using Deribit DVOL: {dvol:.2%}")
@@ -334,8 +383,9 @@ class BTCPricePredictionStrategy:
                 
                 edge = model_cond_prob - market_cond_prob
                 
-                logger.info(f"  Pair {m1.strike_price}k -> {m2.strike_price}k: "
-                           f"Mkt Cond: {market_cond_prob:.2%} | Model Cond: {model_cond_prob:.2%} | Edge: {edge:.2%}")
+                logger.info("  Pair %sk -> %sk: Mkt Cond: %.2f%% | Model Cond: %.2f%% | Edge: %.2f%%",
+                            m1.strike_price, m2.strike_price,
+                            market_cond_prob * 100, model_cond_prob * 100, edge * 100)
                 
                 if edge > self.min_edge:
                     # Market underestimates the conditional step. Buy the higher strike.
@@ -345,7 +395,7 @@ class BTCPricePredictionStrategy:
                         market_id=m2.market_id,
                         action='buy_yes',
                         price=m2.yes_price,
-                        size=self.config.get('max_size', 50),
+                        size=self.max_size,
                         reason=f"Cond Prob Edge: Mkt {market_cond_prob:.1%} < Model {model_cond_prob:.1%} (Vol {baseline_vol:.0%})",
                         confidence=min(1.0, edge * 5), # Scale confidence
                         token_id=m2.token_ids[0]
@@ -359,7 +409,7 @@ class BTCPricePredictionStrategy:
                         market_id=m2.market_id,
                         action='buy_no',
                         price=m2.no_price,
-                        size=self.config.get('max_size', 50),
+                        size=self.max_size,
                         reason=f"Cond Prob Edge: Mkt {market_cond_prob:.1%} > Model {model_cond_prob:.1%} (Vol {baseline_vol:.0%})",
                         confidence=min(1.0, abs(edge) * 5),
                         token_id=m2.token_ids[1]
@@ -370,10 +420,13 @@ class BTCPricePredictionStrategy:
     def analyze_markets(self, markets_df: pd.DataFrame) -> List[TradeSignal]:
         """Analyze multiple markets for conditional probability opportunities."""
         btc_markets = []
+        if markets_df.empty:
+            return btc_markets
         
         # 1. Parse all markets
-        for _, row in markets_df.iterrows():
-            market_obj = self.parse_market(row.to_dict())
+        # Plain dict records avoid building a Series per row
+        for row in markets_df.to_dict('records'):
+            market_obj = self.parse_market(row)
             if market_obj:
                 btc_markets.append(market_obj)
                 
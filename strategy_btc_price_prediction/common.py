@@ -10,7 +10,7 @@ from kalshi_client import get_kalshi_client, KalshiClient
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """Trade signal with minimal data for fast execution."""
     market_id: str  # Kalshi ticker
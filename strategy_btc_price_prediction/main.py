@@ -9,8 +9,10 @@ external price feeds and volatility analysis.
 """
 
 import os
+import re
 import sys
 import logging
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -27,6 +29,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Single case-insensitive scan instead of lowering the title and testing each keyword
+BTC_TITLE_PATTERN = re.compile(r"bitcoin|btc", re.IGNORECASE)
+
 def main():
     """Main function to run the BTC price prediction strategy."""
     logger.info("Starting Kalshi BTC Price Prediction Strategy")
@@ -37,39 +42,48 @@ def main():
     try:
         # Search for BTC-related markets
         # Kalshi might have markets like "Will Bitcoin close above X by date Y"
-        markets_response = client.get_markets(limit=100, status='open')
+        # Filter server-side when a BTC series ticker is configured
+        series_ticker = os.getenv('KALSHI_BTC_SERIES_TICKER')  # e.g., KXBTCD
+        markets_response = client.get_markets(limit=100, status='open', series_ticker=series_ticker)
         markets = markets_response.get('markets', [])
         
-        btc_markets = [m for m in markets if 'bitcoin' in m.get('title', '').lower() or 
-                      'btc' in m.get('title', '').lower()]
+        if series_ticker:
+            btc_markets = markets
+        else:
+            # One vectorized pass over all titles rather than a per-market Python check
+            titles = pd.Series([m.get('title', '') for m in markets], dtype=object)
+            mask = titles.str.contains(BTC_TITLE_PATTERN, na=False).to_numpy(dtype=bool)
+            btc_markets = [markets[i] for i in np.flatnonzero(mask)]
         
         logger.info(f"Found {len(btc_markets)} BTC-related markets")
         
+        # Fetch all orderbooks concurrently instead of one round-trip at a time
+        orderbooks = client.get_orderbooks([m.get('ticker') for m in btc_markets])
+        
         for market in btc_markets:
             ticker = market.get('ticker')
             title = market.get('title', '')
             
             logger.info(f"Market: {ticker} - {title}")
             
-            # Get orderbook
-            try:
-                orderbook = client.get_orderbook(ticker)
-                yes_bids = orderbook.get('yes', [])
-                no_bids = orderbook.get('no', [])
+            orderbook = orderbooks.get(ticker)
+            if isinstance(orderbook, Exception):
+                logger.error(f"Error fetching orderbook for {ticker}: {orderbook}")
+                continue
+            
+            yes_bids = orderbook.get('yes', [])
+            no_bids = orderbook.get('no', [])
+            
+            if yes_bids and no_bids:
+                yes_best = yes_bids[0] if yes_bids else None
+                no_best = no_bids[0] if no_bids else None
+                
+                logger.info(f"  Yes: {yes_best}, No: {no_best}")
                 
-                if yes_bids and no_bids:
-                    yes_best = yes_bids[0] if yes_bids else None
-                    no_best = no_bids[0] if no_bids else None
-                    
-                    logger.info(f"  Yes: {yes_best}, No: {no_best}")
-                    
-                    # TODO: Add your custom BTC prediction logic here
-                    # Example: Compare market prices with external BTC price feeds
-                    # Example: Use volatility analysis
-                    # Example: Apply conditional probability models
-                    
-            except Exception as e:
-                logger.error(f"Error fetching orderbook for {ticker}: {e}")
+                # TODO: Add your custom BTC prediction logic here
+                # Example: Compare market prices with external BTC price feeds
+                # Example: Use volatility analysis
+                # Example: Apply conditional probability models
         
     except Exception as e:
         logger.error(f"Error in BTC strategy: {e}", exc_info=True)
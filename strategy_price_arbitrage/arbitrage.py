@@ -7,6 +7,7 @@ Adapted for Kalshi markets.
 import logging
 from typing import List, Dict, Optional
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from common import TradeSignal, get_client
@@ -19,66 +20,61 @@ class PriceArbitrageStrategy:
     def __init__(self, config: Dict):
         self.config = config
         self.client = get_client()  # Use Kalshi client
+        # Config is fixed after construction; resolve it once instead of per call
+        self.threshold = config.get('threshold', 0.03)
+        self.max_size = config.get('max_size', 100)
     
-    def analyze_market(self, market_data: Dict) -> List[TradeSignal]:
-        """Analyze market for arbitrage opportunities using market orders."""
-        signals = []
-        
-        yes_price = market_data.get('yes_price', 0)
-        no_price = market_data.get('no_price', 0)
-        ticker = market_data.get('ticker', '')
+    def analyze_markets(self, markets_df: pd.DataFrame) -> List[TradeSignal]:
+        """Analyze markets for arbitrage opportunities using market orders.
         
-        if yes_price == 0 or no_price == 0 or not ticker:
-            return signals
+        The opportunity test runs over whole columns and signals are only
+        built for the rows that pass it. Missing volume counts as zero.
+        """
+        all_signals = []
+        if markets_df.empty:
+            return all_signals
         
-        total = yes_price + no_price
         # Threshold for arbitrage accounting for fees and slippage
-        threshold = self.config.get('threshold', 0.03)
+        threshold = self.threshold
+        max_size = self.max_size
+        
+        tickers = markets_df['ticker'].fillna('').to_numpy(dtype=object)
+        yes = markets_df['yes_price'].fillna(0).to_numpy(dtype=np.float64)
+        no = markets_df['no_price'].fillna(0).to_numpy(dtype=np.float64)
+        if 'volume' in markets_df:
+            volume = markets_df['volume'].fillna(0).to_numpy(dtype=np.float64)
+        else:
+            volume = np.zeros(len(markets_df), dtype=np.float64)
+        
+        total = yes + no
+        mask = (yes != 0) & (no != 0) & (tickers != '') & (total < (1 - threshold))
         
-        if total < (1 - threshold):
-            # Arbitrage opportunity: place market orders on both sides
-            size = min(
-                self.config.get('max_size', 100),
-                market_data.get('volume', 0) * 0.01
-            )
-            
-            # Convert size to integer contracts (Kalshi uses integer contracts)
-            size_contracts = int(size)
-            if size_contracts < 1:
-                size_contracts = 1
-            
-            # Calculate potential profit
-            total_cost = (yes_price + no_price) * size_contracts
-            profit = (1 - total) * size_contracts
-            
-            # Signal for YES (market order)
-            signals.append(TradeSignal(
+        # Integer contracts (Kalshi uses integer contracts), at least 1
+        size_contracts = np.maximum(np.minimum(max_size, volume * 0.01).astype(np.int64), 1)
+        profit = (1 - total) * size_contracts
+        confidence = np.minimum(1.0, (1 - total) / threshold)
+        
+        for i in np.flatnonzero(mask):
+            ticker = tickers[i]
+            size = int(size_contracts[i])
+            reason = f'Arbitrage: total {total[i]:.4f} < 1, potential profit ${profit[i]:.2f}'
+            conf = float(confidence[i])
+            all_signals.append(TradeSignal(
                 market_id=ticker,
                 action='buy_yes',
-                price=yes_price,
-                size=size_contracts,
-                reason=f'Arbitrage: total {total:.4f} < 1, potential profit ${profit:.2f}',
-                confidence=min(1.0, (1 - total) / threshold),
+                price=float(yes[i]),
+                size=size,
+                reason=reason,
+                confidence=conf,
                 ticker=ticker
             ))
-            
-            # Signal for NO (market order)
-            signals.append(TradeSignal(
+            all_signals.append(TradeSignal(
                 market_id=ticker,
                 action='buy_no',
-                price=no_price,
-                size=size_contracts,
-                reason=f'Arbitrage: total {total:.4f} < 1, potential profit ${profit:.2f}',
-                confidence=min(1.0, (1 - total) / threshold),
+                price=float(no[i]),
+                size=size,
+                reason=reason,
+                confidence=conf,
                 ticker=ticker
             ))
-        
-        return signals
-    
-    def analyze_markets(self, markets_df: pd.DataFrame) -> List[TradeSignal]:
-        """Analyze multiple markets."""
-        all_signals = []
-        for _, market in markets_df.iterrows():
-            signals = self.analyze_market(market.to_dict())
-            all_signals.extend(signals)
-        return all_signals
\ No newline at end of file
+        return all_signals
@@ -6,7 +6,10 @@ Standalone runner for Kalshi deployment
 
 import os
 import sys
+import asyncio
 import logging
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -24,6 +27,41 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# TradeSignal.action -> (order action, contract side) for execute_market_order
+SIGNAL_ORDER_SIDES = {
+    'buy_yes': ('buy', 'yes'),
+    'buy_no': ('buy', 'no'),
+    'sell_yes': ('sell', 'yes'),
+    'sell_no': ('sell', 'no'),
+}
+
+def parse_order_id(result: Dict) -> Optional[str]:
+    """Pull the order ID out of a create-order response without formatting the whole payload."""
+    order = result.get('order')
+    if isinstance(order, dict):
+        return order.get('order_id')
+    return result.get('order_id')
+
+async def execute_signals(client, signals: List[TradeSignal]) -> List[Optional[Dict]]:
+    """Submit market orders for all signals concurrently, returning results in signal order."""
+    async def _execute(signal: TradeSignal) -> Optional[Dict]:
+        logger.info("Executing arbitrage signal: %s - %s %s contracts @ $%.2f",
+                    signal.market_id, signal.action, signal.size, signal.price)
+        
+        # Determine action and side
+        action, side = SIGNAL_ORDER_SIDES.get(signal.action, ('sell', 'no'))
+        
+        # The client is blocking, so run each order on a worker thread
+        return await asyncio.to_thread(
+            client.execute_market_order,
+            ticker=signal.ticker,
+            side=side,
+            count=signal.size,
+            action=action
+        )
+    
+    return await asyncio.gather(*(_execute(signal) for signal in signals))
+
 def main():
     """Main function to run the price arbitrage strategy."""
     logger.info("Starting Kalshi Price Arbitrage Strategy")
@@ -48,78 +86,75 @@ def main():
             return
         
         # Convert to DataFrame with orderbook data
-        market_data_list = []
-        for market in markets[:20]:  # Limit to first 20 markets for testing
-            ticker = market.get('ticker')
-            if not ticker:
-                continue
+        markets = [m for m in markets[:20] if m.get('ticker')]  # Limit to first 20 markets for testing
+        
+        # Fetch all orderbooks concurrently instead of one round-trip at a time
+        orderbooks = client.get_orderbooks([m['ticker'] for m in markets])
+        
+        # Market metadata as columns in one pass; orderbook prices are merged in below
+        meta_df = pd.json_normalize(markets).reindex(columns=['ticker', 'volume'])
+        
+        # Fill typed price arrays in one pass and build the DataFrame once
+        n = len(meta_df)
+        tickers = []
+        yes_cents = np.empty(n, dtype=np.float64)
+        no_cents = np.empty(n, dtype=np.float64)
+        
+        for ticker in meta_df['ticker']:
+            orderbook = orderbooks.get(ticker)
             
-            try:
-                # Get orderbook for pricing
-                orderbook = client.get_orderbook(ticker)
-                
-                # Extract best prices from orderbook
-                yes_bids = orderbook.get('yes', [])
-                no_bids = orderbook.get('no', [])
-                
-                if yes_bids and no_bids:
-                    # Get best ask prices (what we'd pay to buy)
-                    yes_ask = min([order[0] for order in yes_bids if len(order) > 0], default=0)
-                    no_ask = min([order[0] for order in no_bids if len(order) > 0], default=0)
-                    
-                    # Convert from cents to dollars
-                    yes_price = yes_ask / 100.0 if yes_ask else 0
-                    no_price = no_ask / 100.0 if no_ask else 0
-                    
-                    market_data_list.append({
-                        'ticker': ticker,
-                        'yes_price': yes_price,
-                        'no_price': no_price,
-                        'volume': market.get('volume', 0)
-                    })
-            except Exception as e:
-                logger.error(f"Error fetching orderbook for {ticker}: {e}")
+            if isinstance(orderbook, Exception):
+                logger.error(f"Error fetching orderbook for {ticker}: {orderbook}")
                 continue
+            
+            # Extract best prices from orderbook
+            yes_bids = orderbook.get('yes', [])
+            no_bids = orderbook.get('no', [])
+            
+            if yes_bids and no_bids:
+                # Get best ask prices (what we'd pay to buy)
+                k = len(tickers)
+                yes_cents[k] = min([order[0] for order in yes_bids if len(order) > 0], default=0)
+                no_cents[k] = min([order[0] for order in no_bids if len(order) > 0], default=0)
+                tickers.append(ticker)
         
-        if not market_data_list:
+        if not tickers:
             logger.warning("No valid market data retrieved")
             return
         
-        markets_df = pd.DataFrame(market_data_list)
+        k = len(tickers)
+        markets_df = pd.DataFrame({
+            'ticker': tickers,
+            # Convert from cents to dollars
+            'yes_price': yes_cents[:k] / 100.0,
+            'no_price': no_cents[:k] / 100.0
+        }).merge(meta_df, on='ticker', how='left')
+        markets_df['volume'] = markets_df['volume'].fillna(0).astype(np.float64)
         
         # Analyze markets for arbitrage opportunities
         signals = strategy.analyze_markets(markets_df)
         logger.info(f"Generated {len(signals)} arbitrage signals")
         
         # Execute arbitrage signals using market orders
-        executed_trades = []
         for signal in signals:
-            if signal.ticker:
-                logger.info(f"Executing arbitrage signal: {signal.market_id} - {signal.action} "
-                           f"{signal.size} contracts @ ${signal.price:.2f}")
-                
-                # Determine action and side
-                action = 'buy' if 'buy' in signal.action else 'sell'
-                side = 'yes' if 'yes' in signal.action else 'no'
-                
-                # Execute market order
-                result = client.execute_market_order(
-                    ticker=signal.ticker,
-                    side=side,
-                    count=signal.size,
-                    action=action
-                )
-                
-                if result:
-                    executed_trades.append({
-                        'signal': signal,
-                        'result': result
-                    })
-                    logger.info(f"Successfully executed arbitrage trade: {result}")
-                else:
-                    logger.warning(f"Failed to execute arbitrage trade for {signal.market_id}")
-            else:
+            if not signal.ticker:
                 logger.warning(f"No ticker for arbitrage signal: {signal.market_id}")
+        executable = [signal for signal in signals if signal.ticker]
+        
+        # Submit every leg concurrently so both sides of an arb reach the book together
+        results = asyncio.run(execute_signals(client, executable))
+        
+        executed_trades = []
+        for signal, result in zip(executable, results):
+            if result:
+                executed_trades.append({
+                    'signal': signal,
+                    'result': result
+                })
+                logger.info("Successfully executed arbitrage trade: %s %s order_id=%s",
+                            signal.market_id, signal.action, parse_order_id(result))
+            else:
+                logger.warning("Failed to execute arbitrage trade for %s", signal.market_id)
         
         logger.info(f"Completed arbitrage execution: {len(executed_trades)}/{len(signals)} trades executed")
     